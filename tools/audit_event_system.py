@@ -14,47 +14,139 @@ Exit codes:
 """
 
 import json
+import os
 import re
+import string
 import sys
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, Iterator, List, Set, Tuple, Optional
 from dataclasses import dataclass, field
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson parses bytes directly and is faster; stdlib json also accepts bytes.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Patterns are compiled once at import
+_STRUCT_RE = re.compile(r'type RawEvent struct \{(.*?)\n\}', re.DOTALL)
+_CONST_RE = re.compile(r'Event\w+\s+EventType\s+=\s+"([^"]+)"')
+
+# Characters allowed in a Go field type, e.g. *[]models.Player
+_GO_TYPE_CHARS = frozenset(string.ascii_letters + string.digits + '_.*[]')
+_JSON_TAG_OPEN = '`json:"'
+
+def _iter_struct_fields(struct_body: str) -> Iterator[Tuple[str, str, str]]:
+    """Yield (field_name, go_type, json_tag) for each json-tagged struct line
+    
+    Fields are line-delimited with a fixed Name Type `json:"tag"` shape,
+    so a split/find scanner is enough. Lines whose tag holds anything besides
+    the json key are skipped.
+    """
+    for line in struct_body.split('\n'):
+        line = line.strip()
+        if not line or line.startswith('//'):
+            continue
+        
+        tick = line.find(_JSON_TAG_OPEN)
+        if tick == -1 or not line[tick - 1:tick].isspace():
+            continue
+        tag_start = tick + len(_JSON_TAG_OPEN)
+        tag_end = line.find('"', tag_start)
+        if tag_end <= tag_start or line[tag_end + 1:tag_end + 2] != '`':
+            continue
+        
+        decl = line[:tick].split()
+        if len(decl) < 2:
+            continue
+        field_name, go_type = decl[-2], decl[-1]
+        if not (field_name.isidentifier() and _GO_TYPE_CHARS.issuperset(go_type)):
+            continue
+        
+        yield field_name, go_type, line[tag_start:tag_end]
+
+# Byte markers used by the .bru scanner in parse_bru_file
+_META_OPEN = b'meta {'
+_NAME_KEY = b'name:'
+_BODY_JSON_OPEN = b'body:json {'
+_BLOCK_CLOSE = b'\n}'
+
+# Error messages for payload fields that are not in the Go struct. Common
+# mistakes get a specific hint; anything else falls back to _unknown_field_error.
+_FIELD_ERROR_BUILDERS = {
+    'event_type': lambda file_name, field_name: (
+        f"❌ {file_name}: Uses 'event_type' instead of 'type'"
+    ),
+    'guid': lambda file_name, field_name: (
+        f"❌ {file_name}: Ambiguous 'guid' field (should be player_guid, attacker_guid, or victim_guid)"
+    ),
+}
+
+def _unknown_field_error(file_name: str, field_name: str) -> str:
+    return f"❌ {file_name}: Unknown field '{field_name}' (not in Go struct)"
+
+# Bit flags for the GUID fields present in a payload
+_GUID = 1
+_PLAYER_GUID = 2
+_ATTACKER_GUID = 4
+_VICTIM_GUID = 8
+_COMBAT_GUIDS = _ATTACKER_GUID | _VICTIM_GUID
+
+# Only the first issues are shown in the summary, so only those are kept
+MAX_STORED_ISSUES = 50
+
+# Color codes for terminal output; disabled once at import when NO_COLOR is set
+_USE_COLOR = not os.environ.get('NO_COLOR')
 
-# Color codes for terminal output
 class Color:
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    MAGENTA = '\033[95m'
-    CYAN = '\033[96m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+    RED = '\033[91m' if _USE_COLOR else ''
+    GREEN = '\033[92m' if _USE_COLOR else ''
+    YELLOW = '\033[93m' if _USE_COLOR else ''
+    BLUE = '\033[94m' if _USE_COLOR else ''
+    MAGENTA = '\033[95m' if _USE_COLOR else ''
+    CYAN = '\033[96m' if _USE_COLOR else ''
+    BOLD = '\033[1m' if _USE_COLOR else ''
+    END = '\033[0m' if _USE_COLOR else ''
+
+# Message templates with the color codes already baked in
+_PHASE_FMT = f'{Color.BLUE}[{{n}}/6] {{msg}}{Color.END}'
+_PASS_FMT = f'      {Color.GREEN}✓ {{}}{Color.END}'
+_FAIL_FMT = f'      {Color.RED}✗ {{}}{Color.END}'
+_WARN_FMT = f'      {Color.YELLOW}⚠ {{}}{Color.END}'
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Tracks validation results"""
     passed: int = 0
     failed: int = 0
     warnings: int = 0
-    errors: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)  # First MAX_STORED_ISSUES only
+    total_issues: int = 0
+    
+    def _record(self, msg: str):
+        self.total_issues += 1
+        if len(self.errors) < MAX_STORED_ISSUES:
+            self.errors.append(msg)
     
     def add_error(self, msg: str):
-        self.errors.append(msg)
+        self._record(msg)
         self.failed += 1
     
     def add_pass(self):
         self.passed += 1
     
     def add_warning(self, msg: str):
-        self.errors.append(f"⚠️  {msg}")
+        self._record(f"⚠️  {msg}")
         self.warnings += 1
     
     def is_success(self) -> bool:
         return self.failed == 0
 
-@dataclass  
+@dataclass(slots=True, frozen=True)
 class GoStructField:
     """Represents a Go struct field with its JSON tag"""
     name: str
@@ -62,7 +154,7 @@ class GoStructField:
     json_name: str
     is_required: bool  # True if no omitempty tag
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BrunoEvent:
     """Represents a parsed Bruno .bru file"""
     file_path: Path
@@ -73,6 +165,18 @@ class BrunoEvent:
 class EventSystemAuditor:
     """Main auditor class"""
     
+    COMBAT_EVENTS = frozenset({
+        'player_kill', 'bot_killed', 'team_kill', 'damage', 
+        'player_damage', 'bot_damage', 'team_damage'
+    })
+    
+    SINGLE_PLAYER_EVENTS = frozenset({
+        'jump', 'crouch', 'prone', 'stand', 'sprint', 'walk',
+        'spawn', 'respawn', 'say', 'say_team', 'connect', 'disconnect',
+        'weapon_pickup', 'weapon_switch', 'weapon_drop', 'reload',
+        'item_pickup', 'item_use', 'item_drop'
+    })
+    
     def __init__(self, base_dir: Path):
         self.base_dir = base_dir
         self.go_fields: Dict[str, GoStructField] = {}
@@ -86,30 +190,30 @@ class EventSystemAuditor:
         print(f"{Color.BOLD}{Color.CYAN}🔍 EVENT SYSTEM AUDIT{Color.END}\n")
         
         # Phase 1: Parse Go struct
-        print(f"{Color.BLUE}[1/6] Parsing Go RawEvent struct...{Color.END}")
+        print(_PHASE_FMT.format(n=1, msg="Parsing Go RawEvent struct..."))
         self.parse_go_struct()
         print(f"      Found {len(self.go_fields)} fields in RawEvent struct")
         
         # Phase 2: Parse event types enum
-        print(f"\n{Color.BLUE}[2/6] Parsing EventType enum...{Color.END}")
+        print("\n" + _PHASE_FMT.format(n=2, msg="Parsing EventType enum..."))
         self.parse_event_types_enum()
         print(f"      Found {len(self.event_types_go)} event types in Go")
         
         # Phase 3: Parse Bruno files
-        print(f"\n{Color.BLUE}[3/6] Parsing Bruno .bru files...{Color.END}")
+        print("\n" + _PHASE_FMT.format(n=3, msg="Parsing Bruno .bru files..."))
         self.parse_bruno_files()
         print(f"      Found {len(self.bruno_events)} Bruno event files")
         
         # Phase 4: Validate field names
-        print(f"\n{Color.BLUE}[4/6] Validating Bruno payloads against Go struct...{Color.END}")
+        print("\n" + _PHASE_FMT.format(n=4, msg="Validating Bruno payloads against Go struct..."))
         self.validate_bruno_payloads()
         
         # Phase 5: Validate GUID fields
-        print(f"\n{Color.BLUE}[5/6] Validating GUID field disambiguation...{Color.END}")
+        print("\n" + _PHASE_FMT.format(n=5, msg="Validating GUID field disambiguation..."))
         self.validate_guid_fields()
         
         # Phase 6: Validate event counts
-        print(f"\n{Color.BLUE}[6/6] Validating event type counts...{Color.END}")
+        print("\n" + _PHASE_FMT.format(n=6, msg="Validating event type counts..."))
         self.validate_event_counts()
         
         # Print summary
@@ -128,11 +232,7 @@ class EventSystemAuditor:
         content = events_file.read_text()
         
         # Extract RawEvent struct
-        struct_match = re.search(
-            r'type RawEvent struct \{(.*?)\n\}',
-            content,
-            re.DOTALL
-        )
+        struct_match = _STRUCT_RE.search(content)
         
         if not struct_match:
             self.results.add_error("Cannot find RawEvent struct definition")
@@ -140,23 +240,15 @@ class EventSystemAuditor:
         
         struct_body = struct_match.group(1)
         
-        # Parse each field
-        field_pattern = r'(\w+)\s+([\w\.\*\[\]]+)\s+`json:"([^"]+)"`'
-        for match in re.finditer(field_pattern, struct_body):
-            field_name = match.group(1)
-            go_type = match.group(2)
-            json_tag = match.group(3)
-            
-            # Parse JSON tag
-            json_parts = json_tag.split(',')
-            json_name = json_parts[0]
-            is_required = 'omitempty' not in json_parts
-            
+        # Parse each field; the JSON name is the tag text before the first comma
+        self.go_fields = {}
+        for field_name, go_type, json_tag in _iter_struct_fields(struct_body):
+            json_name, _, options = json_tag.partition(',')
             self.go_fields[json_name] = GoStructField(
                 name=field_name,
                 go_type=go_type,
                 json_name=json_name,
-                is_required=is_required
+                is_required='omitempty' not in options.split(',')
             )
     
     def parse_event_types_enum(self):
@@ -170,11 +262,7 @@ class EventSystemAuditor:
         content = enum_file.read_text()
         
         # Extract all EventType constants
-        const_pattern = r'Event\w+\s+EventType\s+=\s+"([^"]+)"'
-        
-        for match in re.finditer(const_pattern, content):
-            event_value = match.group(1)
-            self.event_types_go.add(event_value)
+        self.event_types_go = {match.group(1) for match in _CONST_RE.finditer(content)}
     
     def parse_bruno_files(self):
         """Parse all .bru files in bruno/Ingestion/Events/"""
@@ -184,33 +272,65 @@ class EventSystemAuditor:
             self.results.add_error(f"Cannot find Bruno events directory: {bruno_dir}")
             return
         
-        for bru_file in sorted(bruno_dir.glob("*.bru")):
-            try:
-                event = self.parse_bru_file(bru_file)
+        # scandir reports file type from the directory entry, so no extra stat
+        with os.scandir(bruno_dir) as entries:
+            names = sorted(
+                entry.name for entry in entries
+                if entry.name.endswith('.bru') and entry.is_file()
+            )
+        files = [bruno_dir / name for name in names]
+        workers = min(16, (os.cpu_count() or 1) * 2)
+        
+        # Parse in parallel; results are aggregated here in file order
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for event, error in executor.map(self._safe_parse_bru_file, files):
+                if error:
+                    self.results.add_error(error)
                 if event:
                     self.bruno_events.append(event)
                     self.event_types_bruno.add(event.event_type)
-            except Exception as e:
-                self.results.add_error(f"Failed to parse {bru_file.name}: {e}")
     
-    def parse_bru_file(self, file_path: Path) -> Optional[BrunoEvent]:
-        """Parse a single .bru file and extract JSON payload"""
-        content = file_path.read_text()
-        
-        # Extract event name from meta block
-        name_match = re.search(r'meta \{[^}]*name:\s*([^\n]+)', content)
-        event_name = name_match.group(1).strip() if name_match else file_path.stem
-        
-        # Extract JSON payload from body:json block
-        json_match = re.search(r'body:json \{(.*?)\n\}', content, re.DOTALL)
-        
-        if not json_match:
-            return None
-        
-        json_text = json_match.group(1).strip()
+    def _safe_parse_bru_file(self, file_path: Path) -> Tuple[Optional[BrunoEvent], Optional[str]]:
+        """Wrap parse_bru_file so worker exceptions become error messages"""
+        try:
+            return self.parse_bru_file(file_path)
+        except Exception as e:
+            return None, f"Failed to parse {file_path.name}: {e}"
+    
+    def parse_bru_file(self, file_path: Path) -> Tuple[Optional[BrunoEvent], Optional[str]]:
+        """Parse a single .bru file and extract JSON payload
+        
+        Returns (event, error) without touching shared state so it can run
+        on a worker thread.
+        """
+        data = file_path.read_bytes()
+        
+        # Extract event name from meta block; only the name line is decoded
+        event_name = file_path.stem
+        meta_start = data.find(_META_OPEN)
+        if meta_start != -1:
+            meta_end = data.find(b'}', meta_start + len(_META_OPEN))
+            name_start = data.find(_NAME_KEY, meta_start, meta_end if meta_end != -1 else len(data))
+            if name_start != -1:
+                name_start += len(_NAME_KEY)
+                line_end = data.find(b'\n', name_start)
+                name = data[name_start:line_end if line_end != -1 else len(data)].strip()
+                if name:
+                    event_name = name.decode('utf-8')
+        
+        # Extract JSON payload from body:json block (ends at the first "\n}")
+        body_start = data.find(_BODY_JSON_OPEN)
+        if body_start == -1:
+            return None, None
+        body_start += len(_BODY_JSON_OPEN)
+        body_end = data.find(_BLOCK_CLOSE, body_start)
+        if body_end == -1:
+            return None, None
+        
+        json_text = data[body_start:body_end].strip()
         
         try:
-            payload = json.loads(json_text)
+            payload = _json_loads(json_text)
             event_type = payload.get('type', '')
             
             return BrunoEvent(
@@ -218,81 +338,61 @@ class EventSystemAuditor:
                 event_name=event_name,
                 event_type=event_type,
                 payload=payload
-            )
+            ), None
         except json.JSONDecodeError as e:
-            self.results.add_error(f"{file_path.name}: Invalid JSON - {e}")
-            return None
+            return None, f"{file_path.name}: Invalid JSON - {e}"
     
     def validate_bruno_payloads(self):
         """Validate each Bruno payload against Go struct"""
         print()
         
-        field_mismatches = []
-        unknown_fields = []
+        invalid_fields = []
         missing_type = []
+        known_fields = frozenset(self.go_fields)
         
         for event in self.bruno_events:
+            file_name = event.file_path.name
+            
             # Check if 'type' field exists
             if 'type' not in event.payload:
-                missing_type.append(event.file_path.name)
+                missing_type.append(file_name)
                 self.results.add_error(
-                    f"❌ {event.file_path.name}: Missing required 'type' field"
+                    f"❌ {file_name}: Missing required 'type' field"
                 )
                 continue
             
             # Check each field in payload
-            for field_name, field_value in event.payload.items():
-                if field_name not in self.go_fields:
-                    # Check for common mistakes
-                    if field_name == 'event_type':
-                        field_mismatches.append((event.file_path.name, field_name, 'type'))
-                        self.results.add_error(
-                            f"❌ {event.file_path.name}: Uses 'event_type' instead of 'type'"
-                        )
-                    elif field_name == 'guid':
-                        unknown_fields.append((event.file_path.name, field_name))
-                        self.results.add_error(
-                            f"❌ {event.file_path.name}: Ambiguous 'guid' field (should be player_guid, attacker_guid, or victim_guid)"
-                        )
-                    else:
-                        unknown_fields.append((event.file_path.name, field_name))
-                        self.results.add_error(
-                            f"❌ {event.file_path.name}: Unknown field '{field_name}' (not in Go struct)"
-                        )
+            for field_name in event.payload:
+                if field_name not in known_fields:
+                    invalid_fields.append((file_name, field_name))
+                    build_error = _FIELD_ERROR_BUILDERS.get(field_name, _unknown_field_error)
+                    self.results.add_error(build_error(file_name, field_name))
         
         # Summary for this phase
-        if not field_mismatches and not unknown_fields and not missing_type:
-            print(f"      {Color.GREEN}✓ All Bruno payloads match Go struct schema{Color.END}")
+        if not invalid_fields and not missing_type:
+            print(_PASS_FMT.format("All Bruno payloads match Go struct schema"))
             self.results.add_pass()
         else:
-            print(f"      {Color.RED}✗ Found {len(field_mismatches) + len(unknown_fields) + len(missing_type)} payload validation errors{Color.END}")
+            print(_FAIL_FMT.format(f"Found {len(invalid_fields) + len(missing_type)} payload validation errors"))
     
     def validate_guid_fields(self):
         """Validate GUID fields are properly disambiguated"""
         print()
         
-        combat_events = {
-            'player_kill', 'bot_killed', 'team_kill', 'damage', 
-            'player_damage', 'bot_damage', 'team_damage'
-        }
-        
-        single_player_events = {
-            'jump', 'crouch', 'prone', 'stand', 'sprint', 'walk',
-            'spawn', 'respawn', 'say', 'say_team', 'connect', 'disconnect',
-            'weapon_pickup', 'weapon_switch', 'weapon_drop', 'reload',
-            'item_pickup', 'item_use', 'item_drop'
-        }
-        
         ambiguous_guid_found = False
         
         for event in self.bruno_events:
-            has_ambiguous_guid = 'guid' in event.payload
-            has_player_guid = 'player_guid' in event.payload
-            has_attacker_guid = 'attacker_guid' in event.payload
-            has_victim_guid = 'victim_guid' in event.payload
+            # Four constant-time probes, independent of payload size
+            payload = event.payload
+            mask = (
+                ('guid' in payload) * _GUID
+                | ('player_guid' in payload) * _PLAYER_GUID
+                | ('attacker_guid' in payload) * _ATTACKER_GUID
+                | ('victim_guid' in payload) * _VICTIM_GUID
+            )
             
             # Check for ambiguous 'guid' field
-            if has_ambiguous_guid:
+            if mask & _GUID:
                 ambiguous_guid_found = True
                 self.results.add_error(
                     f"❌ {event.file_path.name}: Uses ambiguous 'guid' field"
@@ -300,15 +400,15 @@ class EventSystemAuditor:
                 continue
             
             # Validate combat events have correct GUID fields
-            if event.event_type in combat_events:
-                if not (has_attacker_guid and has_victim_guid):
+            if event.event_type in self.COMBAT_EVENTS:
+                if mask & _COMBAT_GUIDS != _COMBAT_GUIDS:
                     expected = "attacker_guid AND victim_guid"
                     actual = []
-                    if has_attacker_guid:
+                    if mask & _ATTACKER_GUID:
                         actual.append("attacker_guid")
-                    if has_victim_guid:
+                    if mask & _VICTIM_GUID:
                         actual.append("victim_guid")
-                    if has_player_guid:
+                    if mask & _PLAYER_GUID:
                         actual.append("player_guid")
                     
                     actual_str = ", ".join(actual) if actual else "none"
@@ -317,19 +417,19 @@ class EventSystemAuditor:
                     )
             
             # Validate single-player events have correct GUID field
-            elif event.event_type in single_player_events:
-                if not has_player_guid:
+            elif event.event_type in self.SINGLE_PLAYER_EVENTS:
+                if not mask & _PLAYER_GUID:
                     self.results.add_warning(
                         f"{event.file_path.name}: Single-player event should have player_guid"
                     )
         
         if not ambiguous_guid_found and self.results.warnings == 0:
-            print(f"      {Color.GREEN}✓ All GUID fields properly disambiguated{Color.END}")
+            print(_PASS_FMT.format("All GUID fields properly disambiguated"))
             self.results.add_pass()
         elif ambiguous_guid_found:
-            print(f"      {Color.RED}✗ Found ambiguous 'guid' fields{Color.END}")
+            print(_FAIL_FMT.format("Found ambiguous 'guid' fields"))
         else:
-            print(f"      {Color.YELLOW}⚠ Found GUID field warnings{Color.END}")
+            print(_WARN_FMT.format("Found GUID field warnings"))
     
     def validate_event_counts(self):
         """Validate event counts match across systems"""
@@ -347,10 +447,10 @@ class EventSystemAuditor:
         )
         
         if all_match:
-            print(f"      {Color.GREEN}✓ Event counts match: {expected_count} events{Color.END}")
+            print(_PASS_FMT.format(f"Event counts match: {expected_count} events"))
             self.results.add_pass()
         else:
-            print(f"      {Color.RED}✗ Event count mismatch:{Color.END}")
+            print(_FAIL_FMT.format("Event count mismatch:"))
             print(f"        Expected: {expected_count}")
             print(f"        Go enum: {go_count}")
             print(f"        Bruno event types: {bruno_count}")
@@ -395,11 +495,11 @@ class EventSystemAuditor:
         
         if self.results.errors:
             print(f"\n{Color.CYAN}Issues Found:{Color.END}")
-            for i, error in enumerate(self.results.errors[:50], 1):  # Limit to first 50
+            for i, error in enumerate(self.results.errors, 1):
                 print(f"  {i}. {error}")
             
-            if len(self.results.errors) > 50:
-                print(f"  ... and {len(self.results.errors) - 50} more issues")
+            if self.results.total_issues > len(self.results.errors):
+                print(f"  ... and {self.results.total_issues - len(self.results.errors)} more issues")
         
         print(f"\n{'='*60}")
         
@@ -7,19 +7,155 @@ Parses swagger.yaml and generates .bru request files organized by tags
 import yaml
 import os
 import re
+import string
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Set, Tuple
+from yaml.constructor import SafeConstructor
+from yaml.events import (
+    AliasEvent, MappingEndEvent, MappingStartEvent, ScalarEvent,
+    SequenceEndEvent, SequenceStartEvent,
+)
+from yaml.nodes import MappingNode, ScalarNode, SequenceNode
+from yaml.resolver import Resolver
 
-def load_swagger(swagger_path: str) -> Dict:
-    """Load and parse swagger.yaml"""
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# _compose_node mirrors PyYAML's Composer.compose_node / compose_scalar_node /
+# compose_sequence_node / compose_mapping_node (yaml/composer.py). Keep it in
+# step with those if PyYAML's tag resolution or anchor handling changes.
+def _compose_node(event, events: Iterator, anchors: Dict, resolver: Resolver):
+    """Build a YAML node subtree starting at event, consuming its events"""
+    if isinstance(event, AliasEvent):
+        if event.anchor not in anchors:
+            raise yaml.YAMLError(f"found undefined alias *{event.anchor}")
+        return anchors[event.anchor]
+    
+    if isinstance(event, ScalarEvent):
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = resolver.resolve(ScalarNode, event.value, event.implicit)
+        node = ScalarNode(tag, event.value, style=event.style)
+    elif isinstance(event, SequenceStartEvent):
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = resolver.resolve(SequenceNode, None, event.implicit)
+        node = SequenceNode(tag, [], flow_style=event.flow_style)
+        for child in events:
+            if isinstance(child, SequenceEndEvent):
+                break
+            node.value.append(_compose_node(child, events, anchors, resolver))
+    elif isinstance(event, MappingStartEvent):
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = resolver.resolve(MappingNode, None, event.implicit)
+        node = MappingNode(tag, [], flow_style=event.flow_style)
+        for key_event in events:
+            if isinstance(key_event, MappingEndEvent):
+                break
+            key = _compose_node(key_event, events, anchors, resolver)
+            value = _compose_node(next(events), events, anchors, resolver)
+            node.value.append((key, value))
+    else:
+        raise yaml.YAMLError(f"Unexpected YAML event: {event}")
+    
+    if event.anchor is not None:
+        anchors[event.anchor] = node
+    return node
+
+def _skip_node(event, events: Iterator, anchors: Dict, resolver: Resolver):
+    """Consume the events of a subtree without building it
+    
+    Anchored nodes inside the subtree are still composed and recorded, so
+    later aliases from 'paths' resolve exactly as with yaml.safe_load.
+    """
+    if isinstance(event, AliasEvent):
+        return
+    if event.anchor is not None:
+        _compose_node(event, events, anchors, resolver)
+        return
+    if not isinstance(event, (SequenceStartEvent, MappingStartEvent)):
+        return
+    depth = 1
+    for child in events:
+        if isinstance(child, (SequenceEndEvent, MappingEndEvent)):
+            depth -= 1
+            if depth == 0:
+                return
+        elif isinstance(child, AliasEvent):
+            continue
+        elif child.anchor is not None:
+            _compose_node(child, events, anchors, resolver)
+        elif isinstance(child, (SequenceStartEvent, MappingStartEvent)):
+            depth += 1
+
+def iter_swagger_paths(swagger_path: str) -> Iterator[Tuple[str, Dict]]:
+    """Yield (path, methods) pairs from swagger.yaml one endpoint at a time
+    
+    Walks the YAML event stream so only the current path's subtree is
+    materialized; definitions and other top-level sections are skipped.
+    """
+    resolver = Resolver()
+    constructor = SafeConstructor()
+    anchors: Dict = {}
+    
     with open(swagger_path, 'r') as f:
-        return yaml.safe_load(f)
+        events = iter(yaml.parse(f, Loader=SafeLoader))
+        
+        # Advance to the top-level mapping
+        for event in events:
+            if isinstance(event, MappingStartEvent):
+                break
+        else:
+            return
+        
+        for key_event in events:
+            if isinstance(key_event, MappingEndEvent):
+                return
+            
+            if not (isinstance(key_event, ScalarEvent) and key_event.value == 'paths'):
+                _skip_node(key_event, events, anchors, resolver)
+                _skip_node(next(events), events, anchors, resolver)
+                continue
+            
+            value_event = next(events)
+            if not isinstance(value_event, MappingStartEvent):
+                _skip_node(value_event, events, anchors, resolver)
+                continue
+            
+            for path_event in events:
+                if isinstance(path_event, MappingEndEvent):
+                    break
+                path = constructor.construct_document(
+                    _compose_node(path_event, events, anchors, resolver))
+                methods = constructor.construct_document(
+                    _compose_node(next(events), events, anchors, resolver))
+                yield path, methods
+
+# sanitize_filename helpers, built once at import. Slashes are already
+# dropped as special characters, so only whitespace runs become hyphens.
+_FILENAME_KEEP = set(string.ascii_letters + string.digits + '-_')
+_UNSAFE_ASCII_TABLE = str.maketrans({
+    chr(i): None for i in range(128)
+    if chr(i) not in _FILENAME_KEEP and not chr(i).isspace()
+})
+_UNSAFE_CHARS_RE = re.compile(r'[^a-zA-Z0-9\s\-_]')
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
 
 def sanitize_filename(name: str) -> str:
     """Convert endpoint name to valid filename"""
-    # Remove special characters, replace spaces/slashes with hyphens
-    name = re.sub(r'[^a-zA-Z0-9\s\-_]', '', name)
-    name = re.sub(r'[\s/]+', '-', name)
+    # Remove special characters (C-level translate for the common ASCII case),
+    # then replace whitespace runs with hyphens
+    if name.isascii():
+        name = name.translate(_UNSAFE_ASCII_TABLE)
+    else:
+        name = _UNSAFE_CHARS_RE.sub('', name)
+    name = _WHITESPACE_RUN_RE.sub('-', name)
     return name.strip('-').lower()
 
 def get_method_color(method: str) -> str:
@@ -35,9 +171,21 @@ def get_method_color(method: str) -> str:
     }
     return colors.get(method.lower(), 'white')
 
+_PATH_PARAM_RE = re.compile(r'\{([^}]+)\}')
+
+HTTP_METHODS = ('get', 'post', 'put', 'patch', 'delete', 'head', 'options')
+BODY_METHODS = frozenset(('post', 'put', 'patch'))
+
+# Request block pieces around the URL, formatted once per verb / body type
+_METHOD_HEADERS = {m: f'{m} {{\n  url: {{{{base_url}}}}' for m in HTTP_METHODS}
+_REQUEST_BLOCK_TAILS = {
+    True: '\n  body: json\n  auth: none\n}\n',
+    False: '\n  body: none\n  auth: none\n}\n',
+}
+
 def extract_path_params(path: str) -> List[str]:
     """Extract parameter names from path like /stats/player/{guid}"""
-    return re.findall(r'\{([^}]+)\}', path)
+    return _PATH_PARAM_RE.findall(path)
 
 def generate_bru_content(
     method: str,
@@ -53,28 +201,31 @@ def generate_bru_content(
     """Generate .bru file content"""
     
     # Build URL with variable substitution
-    url = path
-    for param in extract_path_params(path):
-        url = url.replace(f'{{{param}}}', f'{{{{var:{param}}}}}')
+    url = _PATH_PARAM_RE.sub(lambda m: f'{{{{var:{m.group(1)}}}}}', path)
+    
+    # Decide body type up front so the header is emitted once
+    method_lower = method.lower()
+    has_body = bool(request_body) and method_lower in BODY_METHODS
+    method_header = _METHOD_HEADERS[method_lower]
     
     # Start building .bru content
-    bru = f'''meta {{
+    parts = [
+        f'''meta {{
   name: {summary or path}
   type: http
   seq: 1
 }}
 
-{method.lower()} {{
-  url: {{{{base_url}}}}{url}
-  body: none
-  auth: none
-}}
-'''
+''',
+        method_header,
+        url,
+        _REQUEST_BLOCK_TAILS[has_body],
+    ]
 
     # Add query parameters
     query_params = [p for p in parameters if p.get('in') == 'query']
     if query_params:
-        bru += '\nparams:query {\n'
+        parts.append('\nparams:query {\n')
         for param in query_params:
             param_name = param.get('name', '')
             param_desc = param.get('description', '')
@@ -82,86 +233,87 @@ def generate_bru_content(
             required = '~' if not param.get('required', False) else ''
             
             if default_val:
-                bru += f'  {required}{param_name}: {default_val}\n'
+                parts.append(f'  {required}{param_name}: {default_val}\n')
             else:
-                bru += f'  {required}{param_name}: \n'
-        bru += '}\n'
+                parts.append(f'  {required}{param_name}: \n')
+        parts.append('}\n')
 
     # Add headers based on security requirements
     if security:
-        bru += '\nheaders {\n'
+        parts.append('\nheaders {\n')
         for sec in security:
             if 'ServerToken' in sec:
-                bru += '  X-Server-Token: {{var:server_token}}\n'
+                parts.append('  X-Server-Token: {{var:server_token}}\n')
             elif 'BearerAuth' in sec:
-                bru += '  Authorization: Bearer {{var:bearer_token}}\n'
-        bru += '}\n'
+                parts.append('  Authorization: Bearer {{var:bearer_token}}\n')
+        parts.append('}\n')
 
     # Add request body if POST/PUT/PATCH
-    if request_body and method.lower() in ['post', 'put', 'patch']:
+    if has_body:
         content_type = list(request_body.get('content', {}).keys())[0] if request_body.get('content') else 'application/json'
         
-        # Update body type
-        bru = bru.replace('body: none', f'body: json')
-        
-        bru += f'\nbody:json {{\n'
+        parts.append(f'\nbody:json {{\n')
         if 'application/json' in content_type:
             # Try to generate example JSON from schema
             schema = request_body.get('content', {}).get(content_type, {}).get('schema', {})
-            bru += '  {\n'
-            bru += '    // Add request body here\n'
-            bru += '  }\n'
-        bru += '}\n'
+            parts.append('  {\n')
+            parts.append('    // Add request body here\n')
+            parts.append('  }\n')
+        parts.append('}\n')
 
     # Add documentation
     if description or summary:
-        bru += f'\ndocs {{\n'
+        parts.append(f'\ndocs {{\n')
         if summary:
-            bru += f'  # {summary}\n'
-            bru += f'  \n'
+            parts.append(f'  # {summary}\n')
+            parts.append(f'  \n')
         if description and description != summary:
-            bru += f'  {description}\n'
-            bru += f'  \n'
+            parts.append(f'  {description}\n')
+            parts.append(f'  \n')
         
         # Add response examples
         if responses:
-            bru += f'  ## Responses\n'
-            bru += f'  \n'
+            parts.append(f'  ## Responses\n')
+            parts.append(f'  \n')
             for status_code, resp in responses.items():
                 resp_desc = resp.get('description', status_code)
-                bru += f'  - **{status_code}**: {resp_desc}\n'
+                parts.append(f'  - **{status_code}**: {resp_desc}\n')
         
-        bru += '}\n'
+        parts.append('}\n')
 
     # Add tests/assertions
-    bru += '''
+    parts.append('''
 tests {
   test("Status code is 2xx", function() {
     expect(res.status).to.be.within(200, 299);
   });
 }
-'''
+''')
+
+    return ''.join(parts)
 
-    return bru
+def _write_bru_file(job: Tuple[Path, bytes]):
+    """Write one generated .bru file"""
+    file_path, bru_bytes = job
+    file_path.write_bytes(bru_bytes)
 
 def create_bruno_collection(swagger_path: str, output_dir: str):
     """Generate complete Bruno collection from swagger spec"""
     
-    swagger = load_swagger(swagger_path)
-    base_path = swagger.get('basePath', '')
-    paths = swagger.get('paths', {})
-    
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    # Track files created
+    # Track files created; content is generated first, then written in parallel.
+    # Keyed by path so a later endpoint with the same filename still wins.
     created_files = []
-    folder_stats = {}
+    folder_stats = Counter()
+    write_jobs: Dict[Path, bytes] = {}
+    created_dirs: Set[Path] = set()
     
-    # Process each endpoint
-    for path, methods in paths.items():
+    # Process each endpoint as it is read from the spec
+    for path, methods in iter_swagger_paths(swagger_path):
         for method, spec in methods.items():
-            if method.lower() not in ['get', 'post', 'put', 'patch', 'delete', 'head', 'options']:
+            if method.lower() not in HTTP_METHODS:
                 continue
             
             # Get metadata
@@ -176,7 +328,9 @@ def create_bruno_collection(swagger_path: str, output_dir: str):
             
             # Create folder for tag
             folder_path = output_path / tag
-            folder_path.mkdir(exist_ok=True)
+            if folder_path not in created_dirs:
+                folder_path.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(folder_path)
             
             # Generate filename
             filename = f"{method.upper()} {sanitize_filename(summary or path)}.bru"
@@ -195,12 +349,13 @@ def create_bruno_collection(swagger_path: str, output_dir: str):
                 responses=responses
             )
             
-            # Write file
-            with open(file_path, 'w') as f:
-                f.write(bru_content)
-            
+            write_jobs[file_path] = bru_content.encode('utf-8')
             created_files.append(str(file_path.relative_to(output_path)))
-            folder_stats[tag] = folder_stats.get(tag, 0) + 1
+            folder_stats[tag] += 1
+    
+    # Write files; disk I/O releases the GIL so threads overlap the writes
+    with ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 2)) as executor:
+        list(executor.map(_write_bru_file, write_jobs.items()))
     
     # Print summary
     print(f"\n✓ Bruno Collection Generated Successfully!")
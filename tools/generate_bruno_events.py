@@ -4,9 +4,28 @@ Generate individual Bruno .bru files for each event type.
 This allows manual testing of individual events from the Bruno UI.
 """
 
+import functools
+import json
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+# orjson serializes in C and already emits compact output; fall back to json
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+# Matches EventType constants in event_types_generated.go
+_EVENT_TYPE_RE = re.compile(r'Event\w+\s+EventType\s+=\s+"([^"]+)"')
 
 # Event categories with sample payloads
 EVENT_PAYLOADS = {
@@ -487,27 +506,19 @@ EVENT_PAYLOADS = {
     }
 }
 
+# Add required fields to all payloads if not present (once, at import),
+# then expose them read-only so callers never need defensive copies
+for _payload in EVENT_PAYLOADS.values():
+    _payload.setdefault("match_id", "{{match_id}}")
+    _payload.setdefault("timestamp", 1738540800.0)
+EVENT_PAYLOADS = {
+    event_type: MappingProxyType(payload)
+    for event_type, payload in EVENT_PAYLOADS.items()
+}
 
-def generate_bru_file(event_type: str, payload: dict) -> str:
-    """Generate a .bru file for a single event type."""
-    
-    # Format the JSON payload as compact single-line JSON
-    json_parts = [f'"type":"{event_type}"']
-    for key, value in payload.items():
-        if isinstance(value, str):
-            json_parts.append(f'"{key}":"{value}"')
-        elif isinstance(value, bool):
-            json_parts.append(f'"{key}":{str(value).lower()}')
-        elif isinstance(value, (int, float)):
-            json_parts.append(f'"{key}":{value}')
-    
-    # Wrap in array as API expects []models.RawEvent
-    json_body = "[{" + ",".join(json_parts) + "}]"
-    
-    # Create nice display name
-    display_name = event_type.replace('_', ' ').title()
-    
-    return f"""meta {{
+
+# .bru file layout shared by every event; filled in with str.format
+_BRU_TEMPLATE = """meta {{
   name: {display_name}
   type: http
   seq: 1
@@ -550,10 +561,10 @@ docs {{
   Event Type: `{event_type}`
   
   ### Description
-  This event is posted when a {event_type.replace('_', ' ')} occurs in the game.
+  This event is posted when a {event_words} occurs in the game.
   
   ### Payload Fields
-  {chr(10).join(f"  - `{key}`: {type(value).__name__}" for key, value in payload.items())}
+  {fields_doc}
   
   ### Notes
   - Modify the payload values as needed for your test scenario
@@ -563,6 +574,58 @@ docs {{
 """
 
 
+def generate_bru_file(event_type: str, payload: Mapping, display_name: Optional[str] = None) -> str:
+    """Generate a .bru file for a single event type."""
+    
+    # Format the JSON payload as compact single-line JSON,
+    # wrapped in an array as the API expects []models.RawEvent
+    json_body = _json_dumps([{"type": event_type, **payload}])
+    
+    # Create nice display name unless the caller already has it
+    if display_name is None:
+        display_name = event_type.replace('_', ' ').title()
+    
+    fields_doc = "\n".join(
+        f"  - `{key}`: {type(value).__name__}"
+        for key, value in payload.items()
+    )
+    
+    return _BRU_TEMPLATE.format(
+        display_name=display_name,
+        event_type=event_type,
+        event_words=event_type.replace('_', ' '),
+        json_body=json_body,
+        fields_doc=fields_doc,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _extract_event_types(event_types_file: Path, mtime_ns: int) -> Tuple[str, ...]:
+    """Parse event types from event_types_generated.go.
+    
+    Cached on the file's mtime so repeated calls in one process skip the
+    read and regex scan until the file changes.
+    """
+    content = event_types_file.read_text()
+    return tuple(match.group(1) for match in _EVENT_TYPE_RE.finditer(content))
+
+
+def _write_bru_file(job) -> bool:
+    """Write one generated .bru file, skipping it if the content is unchanged.
+    
+    Returns True if the file was written. Leaving identical files untouched
+    keeps their mtime stable for Git and IDE file watchers.
+    """
+    filepath, bru_bytes = job
+    try:
+        if filepath.stat().st_size == len(bru_bytes) and filepath.read_bytes() == bru_bytes:
+            return False
+    except FileNotFoundError:
+        pass
+    filepath.write_bytes(bru_bytes)
+    return True
+
+
 def main():
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
@@ -576,38 +639,53 @@ def main():
     
     # Parse event types from generated file
     event_types_file = project_root / "internal" / "models" / "event_types_generated.go"
-    with open(event_types_file, 'r') as f:
-        content = f.read()
-    
-    # Extract event types using regex
-    pattern = r'Event\w+\s+EventType\s+=\s+"([^"]+)"'
-    matches = re.findall(pattern, content)
+    event_types = _extract_event_types(event_types_file, event_types_file.stat().st_mtime_ns)
     
+    # Contents are generated here; the files are written afterwards in parallel.
+    # Progress entries keep event order: a filename for each write job, or
+    # None paired with the event type when its payload is missing.
     created_count = 0
-    for event_type in matches:
+    write_jobs = []
+    progress = []
+    for event_type in event_types:
         if event_type in EVENT_PAYLOADS:
-            # Add required fields to all payloads if not present
-            payload = EVENT_PAYLOADS[event_type].copy()
-            if "match_id" not in payload:
-                payload["match_id"] = "{{match_id}}"
-            if "timestamp" not in payload:
-                payload["timestamp"] = 1738540800.0
+            payload = EVENT_PAYLOADS[event_type]
             
-            bru_content = generate_bru_file(event_type, payload)
+            # Display name doubles as the filename: player_kill -> Player Kill.bru
+            display_name = event_type.replace('_', ' ').title()
+            bru_content = generate_bru_file(event_type, payload, display_name)
             
-            # Create filename: player_kill -> Player Kill.bru
-            filename = event_type.replace('_', ' ').title() + ".bru"
+            filename = f"{display_name}.bru"
             filepath = events_dir / filename
             
-            with open(filepath, 'w') as f:
-                f.write(bru_content)
-            
+            write_jobs.append((filepath, bru_content.encode("utf-8")))
             created_count += 1
-            print(f"  ✓ {filename}")
+            progress.append((filename, event_type))
+        else:
+            progress.append((None, event_type))
+    
+    # File I/O releases the GIL, so threads overlap the small writes.
+    # Progress is only reported once every write has succeeded.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        written = list(executor.map(_write_bru_file, write_jobs))
+    written_count = sum(written)
+    
+    # Emit progress in one write rather than one print per file
+    written_iter = iter(written)
+    progress_lines = []
+    for filename, event_type in progress:
+        if filename is None:
+            progress_lines.append(f"  ⚠ Missing payload definition for: {event_type}")
+        elif next(written_iter):
+            progress_lines.append(f"  ✓ {filename}")
         else:
-            print(f"  ⚠ Missing payload definition for: {event_type}")
+            progress_lines.append(f"  = {filename} (unchanged)")
+    if progress_lines:
+        sys.stdout.write("\n".join(progress_lines) + "\n")
     
     print(f"\n✅ Generated {created_count} event .bru files")
+    if written_count < created_count:
+        print(f"   ({created_count - written_count} unchanged, left as-is)")
     print(f"📂 Location: bruno/Ingestion/Events/")
     print(f"\n💡 Next steps:")
     print(f"   1. Open Bruno Desktop")